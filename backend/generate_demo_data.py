@@ -10,6 +10,8 @@ Usage:
     python generate_demo_data.py --logs 1000       # Generate 1000 logs
     python generate_demo_data.py --users 5         # Generate 5 users
     python generate_demo_data.py --clear           # Clear existing data first
+    python generate_demo_data.py --batch-size 5000 # Insert logs in batches of 5000
+    python generate_demo_data.py --fast-insert     # Insert logs via raw cursor
     python generate_demo_data.py --help            # Show help
 """
 
@@ -30,6 +32,8 @@ django.setup()
 # Now import Django modules after setup
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.db.models import Count, Max, Min
 from django.utils import timezone
 from logs_app.models import Log, UserFilterPreference
 
@@ -37,9 +41,18 @@ from logs_app.models import Log, UserFilterPreference
 class DemoDataGenerator:
     """Generate realistic demo data for the logs dashboard."""
 
+    # Weight distribution for severities (more INFO/WARNING, fewer CRITICAL)
+    SEVERITY_WEIGHTS = {
+        Log.DEBUG: 0.20,
+        Log.INFO: 0.40,
+        Log.WARNING: 0.25,
+        Log.ERROR: 0.12,
+        Log.CRITICAL: 0.03,
+    }
+
     # Realistic log messages for different severities
     LOG_MESSAGES = {
-        "DEBUG": [
+        "DEBUG": (
             "Database query executed successfully",
             "User session initialized",
             "Cache hit for user preferences",
@@ -50,8 +63,8 @@ class DemoDataGenerator:
             "Parsing request headers",
             "Initializing security context",
             "Starting background task",
-        ],
-        "INFO": [
+        ),
+        "INFO": (
             "User login successful",
             "New user registration completed",
             "File upload completed",
@@ -67,8 +80,8 @@ class DemoDataGenerator:
             "Password reset requested",
             "User profile updated",
             "Search query executed",
-        ],
-        "WARNING": [
+        ),
+        "WARNING": (
             "High memory usage detected",
             "Slow database query performance",
             "API rate limit approaching",
@@ -81,8 +94,8 @@ class DemoDataGenerator:
             "Session expiring soon",
             "Retry attempt after failure",
             "Performance threshold exceeded",
-        ],
-        "ERROR": [
+        ),
+        "ERROR": (
             "Database connection failed",
             "Authentication failed for user",
             "File upload error occurred",
@@ -97,8 +110,8 @@ class DemoDataGenerator:
             "Configuration file missing",
             "Third-party service error",
             "Email delivery failed",
-        ],
-        "CRITICAL": [
+        ),
+        "CRITICAL": (
             "System out of memory",
             "Database server unresponsive",
             "Security breach detected",
@@ -109,11 +122,11 @@ class DemoDataGenerator:
             "Hardware failure detected",
             "Backup system failure",
             "Critical configuration error",
-        ],
+        ),
     }
 
     # Realistic service sources
-    SOURCES = [
+    SOURCES = (
         "auth_service",
         "user_management",
         "api_gateway",
@@ -134,7 +147,17 @@ class DemoDataGenerator:
         "load_balancer",
         "cdn_service",
         "message_queue",
-    ]
+    )
+
+    # Contextual details appended to some messages, with their value ranges
+    CONTEXT_TEMPLATES = (
+        ("User ID: {}", 1, 1000),
+        ("Session: {}", 10000, 99999),
+        ("Request ID: {}", 100000, 999999),
+        ("Duration: {}ms", 50, 5000),
+        ("Memory: {}MB", 64, 512),
+        ("CPU: {}%", 10, 95),
+    )
 
     # User data for demo accounts
     DEMO_USERS = [
@@ -234,12 +257,20 @@ class DemoDataGenerator:
         """Create demo users."""
         print(f"👥 Creating {count} demo users...")
 
+        demo_users = self.DEMO_USERS[:count]
+
+        # Look up which demo accounts already exist in a single query
+        existing = set(
+            User.objects.filter(
+                username__in=[u["username"] for u in demo_users]
+            ).values_list("username", flat=True)
+        )
+
         users = []
-        for i in range(min(count, len(self.DEMO_USERS))):
-            user_data = self.DEMO_USERS[i].copy()
+        for user_data in demo_users:
+            user_data = user_data.copy()
 
-            # Check if user already exists
-            if User.objects.filter(username=user_data["username"]).exists():
+            if user_data["username"] in existing:
                 user = User.objects.get(username=user_data["username"])
                 print(f"   ℹ️  User {user_data['username']} already exists")
             else:
@@ -254,82 +285,93 @@ class DemoDataGenerator:
         self.created_users = users
         return users
 
-    def create_logs(self, count: int):
-        """Create realistic log entries."""
+    def create_logs(
+        self, count: int, batch_size: int = 1000, fast_insert: bool = False
+    ):
+        """Create realistic log entries, inserting them in batches of batch_size.
+
+        With fast_insert, rows are written as plain tuples through a raw cursor
+        instead of building Log instances for bulk_create.
+        """
         print(f"📝 Generating {count} log entries...")
 
-        # Weight distribution for severities (more INFO/WARNING, fewer CRITICAL)
-        severity_weights = {
-            "DEBUG": 0.20,
-            "INFO": 0.40,
-            "WARNING": 0.25,
-            "ERROR": 0.12,
-            "CRITICAL": 0.03,
-        }
-
-        # Create weighted list of severities
-        weighted_severities = []
-        for severity, weight in severity_weights.items():
-            weighted_severities.extend([severity] * int(weight * 100))
-
-        logs_to_create = []
+        severities = tuple(self.SEVERITY_WEIGHTS)
+        weights = tuple(self.SEVERITY_WEIGHTS.values())
+        msg_pools = self.LOG_MESSAGES
         now = timezone.now()
-
-        for i in range(count):
-            # Generate timestamp within last 30 days with realistic distribution
-            # More recent logs are more likely
-            days_ago = random.choices(
-                range(30), weights=[max(30 - i, 1) for i in range(30)], k=1
-            )[0]
-
-            hours_ago = random.randint(0, 23)
-            minutes_ago = random.randint(0, 59)
-            seconds_ago = random.randint(0, 59)
-
-            timestamp = now - timedelta(
-                days=days_ago, hours=hours_ago, minutes=minutes_ago, seconds=seconds_ago
-            )
-
-            # Select severity with realistic distribution
-            severity = random.choice(weighted_severities)
-
-            # Select source
-            source = random.choice(self.SOURCES)
-
-            # Select message based on severity
-            message = random.choice(self.LOG_MESSAGES[severity])
-
-            # Add contextual details to some messages
-            if random.random() < 0.3:  # 30% chance of additional context
-                contexts = [
-                    f"User ID: {random.randint(1, 1000)}",
-                    f"Session: {random.randint(10000, 99999)}",
-                    f"Request ID: {random.randint(100000, 999999)}",
-                    f"Duration: {random.randint(50, 5000)}ms",
-                    f"Memory: {random.randint(64, 512)}MB",
-                    f"CPU: {random.randint(10, 95)}%",
-                ]
-                message += f" - {random.choice(contexts)}"
-
-            log = Log(
-                timestamp=timestamp,
-                message=message,
-                severity=severity,
-                source=source,
-            )
-            logs_to_create.append(log)
-
-            # Show progress every 100 logs
-            if (i + 1) % 100 == 0:
-                print(f"   📊 Generated {i + 1}/{count} logs...")
-
-        # Bulk create for better performance
-        Log.objects.bulk_create(logs_to_create, batch_size=100)
+        generated = 0
+
+        # Insert every batch in one transaction to avoid a commit per batch
+        with transaction.atomic():
+            while generated < count:
+                # Draw random values one batch at a time so memory stays
+                # bounded for large runs
+                n = min(batch_size, count - generated)
+                sev_list = random.choices(severities, weights=weights, k=n)
+                src_list = random.choices(self.SOURCES, k=n)
+
+                # Generate timestamps within last 30 days with realistic
+                # distribution. More recent logs are more likely
+                days_ago = random.choices(range(30), weights=range(30, 0, -1), k=n)
+                seconds_ago = random.choices(range(86400), k=n)
+
+                logs_to_create = []
+                for severity, source, days, seconds in zip(
+                    sev_list, src_list, days_ago, seconds_ago
+                ):
+                    timestamp = now - timedelta(seconds=days * 86400 + seconds)
+
+                    # Select message based on severity
+                    message = random.choice(msg_pools[severity])
+
+                    # Add contextual details to some messages
+                    if random.random() < 0.3:  # 30% chance of additional context
+                        template, low, high = random.choice(self.CONTEXT_TEMPLATES)
+                        message += " - " + template.format(random.randint(low, high))
+
+                    if fast_insert:
+                        logs_to_create.append(
+                            (
+                                connection.ops.adapt_datetimefield_value(timestamp),
+                                message,
+                                severity,
+                                source,
+                            )
+                        )
+                    else:
+                        log = Log(
+                            timestamp=timestamp,
+                            message=message,
+                            severity=severity,
+                            source=source,
+                        )
+                        logs_to_create.append(log)
+
+                self._insert_logs(logs_to_create, batch_size, fast_insert)
+                generated += n
+                # Show progress once per inserted batch
+                print(f"   📊 Generated {generated}/{count} logs...")
         print(f"✅ Created {count} log entries")
 
         # Show statistics
         self.show_log_statistics()
 
+    def _insert_logs(self, logs: list, batch_size: int, fast_insert: bool):
+        """Insert one batch of logs, either as Log instances or raw row tuples."""
+        if not fast_insert:
+            Log.objects.bulk_create(logs, batch_size=batch_size)
+            return
+
+        qn = connection.ops.quote_name
+        columns = ", ".join(
+            qn(c) for c in ("timestamp", "message", "severity", "source")
+        )
+        sql = (
+            f"INSERT INTO {qn(Log._meta.db_table)} ({columns}) VALUES (%s, %s, %s, %s)"
+        )
+        with connection.cursor() as cursor:
+            cursor.executemany(sql, logs)
+
     def create_filter_preferences(self):
         """Create sample filter preferences for users."""
         if not self.created_users:
@@ -338,12 +380,26 @@ class DemoDataGenerator:
 
         print("🔍 Creating sample filter preferences...")
 
+        # Look up existing presets once instead of catching a conflict per row
+        existing = set(
+            UserFilterPreference.objects.filter(
+                user__in=self.created_users
+            ).values_list("user_id", "name")
+        )
+
+        prefs = []
         for user in self.created_users:
             # Each user gets 2-4 random filter presets
             num_presets = random.randint(2, 4)
             user_presets = random.sample(self.FILTER_PRESETS, num_presets)
 
             for preset in user_presets:
+                if (user.pk, preset["name"]) in existing:
+                    print(
+                        f"   ⚠️  Filter '{preset['name']}' already exists for {user.username}"
+                    )
+                    continue
+
                 # Add some date ranges to some presets
                 date_from = None
                 date_to = None
@@ -355,8 +411,8 @@ class DemoDataGenerator:
                 if random.random() < 0.2:  # 20% chance of end date
                     date_to = timezone.now().date()
 
-                try:
-                    UserFilterPreference.objects.create(
+                prefs.append(
+                    UserFilterPreference(
                         user=user,
                         name=preset["name"],
                         severity=preset["severity"],
@@ -364,31 +420,35 @@ class DemoDataGenerator:
                         date_from=date_from,
                         date_to=date_to,
                     )
-                    print(
-                        f"   ✅ Created filter '{preset['name']}' for {user.username}"
-                    )
-                except Exception as e:
-                    print(
-                        f"   ⚠️  Filter '{preset['name']}' already exists for {user.username}"
-                    )
+                )
+
+        UserFilterPreference.objects.bulk_create(
+            prefs, batch_size=500, ignore_conflicts=True
+        )
+        for pref in prefs:
+            print(f"   ✅ Created filter '{pref.name}' for {pref.user.username}")
 
     def show_log_statistics(self):
         """Display statistics about generated logs."""
         print("\n📈 Log Statistics:")
 
-        total_logs = Log.objects.count()
+        totals = Log.objects.aggregate(
+            total=Count("id"), oldest=Min("timestamp"), newest=Max("timestamp")
+        )
+        total_logs = totals["total"]
         print(f"   Total logs: {total_logs}")
 
         # Severity distribution
+        by_severity = dict(
+            Log.objects.order_by().values_list("severity").annotate(count=Count("id"))
+        )
         for severity, _ in Log.SEVERITY_CHOICES:
-            count = Log.objects.filter(severity=severity).count()
+            count = by_severity.get(severity, 0)
             percentage = (count / total_logs * 100) if total_logs > 0 else 0
             print(f"   {severity}: {count} ({percentage:.1f}%)")
 
         # Top sources
         print("\n📊 Top Sources:")
-        from django.db.models import Count
-
         top_sources = (
             Log.objects.values("source")
             .annotate(count=Count("source"))
@@ -400,10 +460,8 @@ class DemoDataGenerator:
 
         # Date range
         if total_logs > 0:
-            oldest = Log.objects.order_by("timestamp").first()
-            newest = Log.objects.order_by("-timestamp").first()
             print(
-                f"\n📅 Date range: {oldest.timestamp.date()} to {newest.timestamp.date()}"
+                f"\n📅 Date range: {totals['oldest'].date()} to {totals['newest'].date()}"
             )
 
     def show_summary(self):
@@ -411,9 +469,15 @@ class DemoDataGenerator:
         print("\n🎉 Demo Data Generation Complete!")
         print("=" * 50)
 
-        user_count = User.objects.count()
-        log_count = Log.objects.count()
-        filter_count = UserFilterPreference.objects.count()
+        # Fetch all three totals in a single round trip
+        qn = connection.ops.quote_name
+        counts = ", ".join(
+            f"(SELECT COUNT(*) FROM {qn(model._meta.db_table)})"
+            for model in (User, Log, UserFilterPreference)
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT {counts}")
+            user_count, log_count, filter_count = cursor.fetchone()
 
         print(f"👥 Users: {user_count}")
         print(f"📝 Logs: {log_count}")
@@ -444,6 +508,8 @@ Examples:
   python generate_demo_data.py --logs 1000       # Generate 1000 logs
   python generate_demo_data.py --users 5         # Generate 5 users
   python generate_demo_data.py --clear           # Clear existing data first
+  python generate_demo_data.py --batch-size 5000 # Insert logs in batches of 5000
+  python generate_demo_data.py --fast-insert     # Insert logs via raw cursor
         """,
     )
 
@@ -461,6 +527,22 @@ Examples:
         help="Number of demo users to create (default: 3, max: 5)",
     )
 
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=os.environ.get("LOGS_BULK_CREATE_BATCH_SIZE", "1000"),
+        help=(
+            "Number of logs inserted per bulk_create batch "
+            "(default: $LOGS_BULK_CREATE_BATCH_SIZE or 1000)"
+        ),
+    )
+
+    parser.add_argument(
+        "--fast-insert",
+        action="store_true",
+        help="Insert logs with a raw cursor executemany instead of bulk_create",
+    )
+
     parser.add_argument(
         "--clear",
         action="store_true",
@@ -481,6 +563,10 @@ Examples:
         print("❌ Error: Number of users must be between 1 and 5")
         sys.exit(1)
 
+    if args.batch_size < 1:
+        print("❌ Error: Batch size must be at least 1")
+        sys.exit(1)
+
     try:
         generator = DemoDataGenerator()
 
@@ -490,7 +576,7 @@ Examples:
 
         # Generate data
         generator.create_users(args.users)
-        generator.create_logs(args.logs)
+        generator.create_logs(args.logs, args.batch_size, args.fast_insert)
         generator.create_filter_preferences()
 
         # Show summary
@@ -19,6 +19,9 @@ class UserFilterPreference(models.Model):
     class Meta:
         ordering = ["-created_at"]
         unique_together = [["user", "name"]]
+        indexes = [
+            models.Index(fields=["user", "-created_at"]),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.name}"
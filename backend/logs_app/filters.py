@@ -1,7 +1,58 @@
+import re
+
 import django_filters
+from django.db import connection
+from django.db.models import FloatField
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import SearchFilter
 
 from .models import Log
 
+# InnoDB skips words shorter than innodb_ft_min_token_size (3 by default)
+FULLTEXT_MIN_TOKEN_SIZE = 3
+
+# InnoDB's default full-text stopwords, which never match anything
+FULLTEXT_STOPWORDS = frozenset(
+    [
+        "a",
+        "about",
+        "an",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "com",
+        "de",
+        "en",
+        "for",
+        "from",
+        "how",
+        "i",
+        "in",
+        "is",
+        "it",
+        "la",
+        "of",
+        "on",
+        "or",
+        "that",
+        "the",
+        "this",
+        "to",
+        "was",
+        "what",
+        "when",
+        "where",
+        "who",
+        "will",
+        "with",
+        "und",
+        "www",
+    ]
+)
+
 
 class LogFilter(django_filters.FilterSet):
     date_from = django_filters.IsoDateTimeFilter(
@@ -14,3 +65,78 @@ class LogFilter(django_filters.FilterSet):
     class Meta:
         model = Log
         fields = ["severity", "source", "date_from", "date_to"]
+
+
+class LogSearchFilter(SearchFilter):
+    """Search log messages through the MySQL FULLTEXT index instead of a LIKE scan.
+
+    All terms go into a single MATCH over the view's fulltext_search_fields,
+    which must be exactly the columns of the FULLTEXT index. Each term matches
+    as a word prefix. The remaining search_fields keep DRF's substring search:
+    if a term occurs in any of their values, the whole search falls back to
+    icontains. The same fallback applies on other databases and to terms the
+    index can't match as typed (non-word characters, stopwords, and words
+    below the minimum token size).
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        fulltext_fields = getattr(view, "fulltext_search_fields", None)
+        search_fields = self.get_search_fields(view, request)
+        terms = self.get_search_terms(request)
+        if (
+            connection.vendor != "mysql"
+            or not fulltext_fields
+            or not search_fields
+            or not terms
+            or not self.can_use_fulltext(
+                queryset, fulltext_fields, search_fields, terms
+            )
+        ):
+            return super().filter_queryset(request, queryset, view)
+
+        qn = connection.ops.quote_name
+        opts = queryset.model._meta
+        columns = ", ".join(
+            f"{qn(opts.db_table)}.{qn(opts.get_field(field).column)}"
+            for field in fulltext_fields
+        )
+        # MATCH returns a relevance score, so compare it to 0 rather than True
+        return queryset.alias(
+            search_rank=RawSQL(
+                f"MATCH ({columns}) AGAINST (%s IN BOOLEAN MODE)",
+                [" ".join(f"+{term}*" for term in terms)],
+                output_field=FloatField(),
+            )
+        ).filter(search_rank__gt=0)
+
+    def can_use_fulltext(self, queryset, fulltext_fields, search_fields, terms):
+        """Return True if a FULLTEXT MATCH finds the same rows as icontains would."""
+        if not set(fulltext_fields) <= set(search_fields):
+            return False
+        if any(
+            field[0] in self.lookup_prefixes or LOOKUP_SEP in field
+            for field in search_fields
+        ):
+            return False
+        if any(
+            not re.fullmatch(r"\w+", term)
+            or len(term) < FULLTEXT_MIN_TOKEN_SIZE
+            or term.lower() in FULLTEXT_STOPWORDS
+            for term in terms
+        ):
+            return False
+
+        # Other search fields (e.g. source) have few distinct values, so check
+        # them directly for terms that only a substring search would match
+        lowered = [term.lower() for term in terms]
+        for field in search_fields:
+            if field in fulltext_fields:
+                continue
+            values = (
+                queryset.model._default_manager.order_by()
+                .values_list(field, flat=True)
+                .distinct()
+            )
+            if any(term in value.lower() for value in values for term in lowered):
+                return False
+        return True
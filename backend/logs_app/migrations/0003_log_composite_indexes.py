@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-15 01:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("logs_app", "0002_userfilterpreference"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="log",
+            name="logs_app_lo_severit_ddb200_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="log",
+            name="logs_app_lo_source_fa879b_idx",
+        ),
+        migrations.AddIndex(
+            model_name="log",
+            index=models.Index(
+                fields=["source", "timestamp"], name="logs_app_lo_source_9bec5b_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="log",
+            index=models.Index(
+                fields=["severity", "timestamp", "id"],
+                name="logs_app_lo_severit_66b56b_idx",
+            ),
+        ),
+    ]
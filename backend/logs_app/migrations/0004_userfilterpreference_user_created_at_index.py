@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 01:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("logs_app", "0003_log_composite_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="userfilterpreference",
+            index=models.Index(
+                fields=["user", "-created_at"], name="logs_app_us_user_id_c851ab_idx"
+            ),
+        ),
+    ]
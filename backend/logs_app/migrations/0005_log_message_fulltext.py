@@ -0,0 +1,32 @@
+from django.db import migrations
+
+INDEX_NAME = "logs_app_log_message_ft"
+
+
+def create_fulltext_index(apps, schema_editor):
+    """Add a FULLTEXT index on Log.message; only MySQL supports it."""
+    if schema_editor.connection.vendor != "mysql":
+        return
+    qn = schema_editor.quote_name
+    schema_editor.execute(
+        f"CREATE FULLTEXT INDEX {qn(INDEX_NAME)} "
+        f"ON {qn('logs_app_log')} ({qn('message')})"
+    )
+
+
+def drop_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "mysql":
+        return
+    qn = schema_editor.quote_name
+    schema_editor.execute(f"DROP INDEX {qn(INDEX_NAME)} ON {qn('logs_app_log')}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("logs_app", "0004_userfilterpreference_user_created_at_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+    ]
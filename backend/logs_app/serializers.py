@@ -75,6 +75,25 @@ class LogSerializer(serializers.ModelSerializer):
         read_only_fields = ["id"]
 
 
+class LogListSerializer(serializers.ModelSerializer):
+    """Log list representation with a message preview instead of the full text."""
+
+    message_preview = serializers.CharField(read_only=True)
+    message_truncated = serializers.BooleanField(read_only=True)
+
+    class Meta:
+        model = Log
+        fields = [
+            "id",
+            "timestamp",
+            "message_preview",
+            "message_truncated",
+            "severity",
+            "source",
+        ]
+        read_only_fields = ["id"]
+
+
 class UserFilterPreferenceSerializer(serializers.ModelSerializer):
     user = serializers.PrimaryKeyRelatedField(read_only=True)
 
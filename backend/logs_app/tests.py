@@ -0,0 +1,67 @@
+from unittest import mock
+
+from django.db import connections
+from django.db.backends.mysql.base import DatabaseWrapper
+from django.test import TestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from logs_app.filters import LogSearchFilter
+from logs_app.models import Log
+from logs_app.views import LogViewSet
+
+
+class LogSearchFilterMySQLTests(TestCase):
+    """Compile LogSearchFilter queries with the MySQL backend; no server needed."""
+
+    @classmethod
+    def setUpTestData(cls):
+        Log.objects.create(
+            message="Database connection failed",
+            severity=Log.ERROR,
+            source="auth_service",
+        )
+
+    def setUp(self):
+        self.mysql = DatabaseWrapper(
+            {
+                **connections["default"].settings_dict,
+                "ENGINE": "django.db.backends.mysql",
+            }
+        )
+
+    def search_sql(self, term):
+        request = Request(APIRequestFactory().get("/", {"search": term}))
+        with mock.patch("logs_app.filters.connection", self.mysql):
+            qs = LogSearchFilter().filter_queryset(
+                request, Log.objects.all(), LogViewSet()
+            )
+        return qs.query.get_compiler(connection=self.mysql).as_sql()
+
+    def test_fulltext_match_is_compared_to_zero(self):
+        sql, params = self.search_sql("database failed")
+        self.assertIn(
+            "MATCH (`logs_app_log`.`message`) AGAINST (%s IN BOOLEAN MODE)) > %s",
+            sql,
+        )
+        self.assertNotIn("= %s", sql)
+        self.assertNotIn(True, params)
+        self.assertNotIn("LIKE", sql)
+        self.assertEqual(params, ("+database* +failed*", 0))
+
+    def test_term_found_in_a_source_falls_back_to_icontains(self):
+        sql, _ = self.search_sql("service")
+        self.assertNotIn("MATCH", sql)
+        self.assertIn("`logs_app_log`.`source` LIKE", sql)
+
+    def test_term_with_non_word_characters_falls_back_to_icontains(self):
+        for term in ("rate-limit", "192.168", "(timeout)"):
+            with self.subTest(term=term):
+                sql, _ = self.search_sql(term)
+                self.assertNotIn("MATCH", sql)
+
+    def test_stopword_and_short_terms_fall_back_to_icontains(self):
+        for term in ("failed for", "db"):
+            with self.subTest(term=term):
+                sql, _ = self.search_sql(term)
+                self.assertNotIn("MATCH", sql)
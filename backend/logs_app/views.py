@@ -1,17 +1,22 @@
 import csv
+import io
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db.models import Count
-from django.db.models.functions import TruncDay, TruncMonth
+from django.db.models.lookups import GreaterThan
+from django.db.models.functions import Left, Length, TruncDay, TruncMonth
 from django.http import StreamingHttpResponse
-from rest_framework import permissions, status, viewsets
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import filters, permissions, status, viewsets
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from .filters import LogFilter
+from .filters import LogFilter, LogSearchFilter
 from .models import Log, UserFilterPreference
 from .serializers import (
+    LogListSerializer,
     LogSerializer,
     RegisterSerializer,
     UserFilterPreferenceSerializer,
@@ -20,6 +25,12 @@ from .serializers import (
 
 User = get_user_model()
 
+# Number of message characters returned as a preview by the list endpoint
+LIST_MESSAGE_PREVIEW_LENGTH = 120
+
+# Rows are buffered into chunks of about this many characters per CSV write
+CSV_CHUNK_SIZE = 64 * 1024
+
 
 @api_view(["POST"])
 @permission_classes([permissions.AllowAny])
@@ -49,25 +60,38 @@ def get_current_user(request):
     return Response(serializer.data)
 
 
-class Echo:
-    """An object that implements just the write method of the file-like interface."""
-
-    def write(self, value):
-        """Write the value by returning it, instead of storing in a buffer."""
-        return value
-
-
 class LogViewSet(viewsets.ModelViewSet):
     queryset = Log.objects.all()
     serializer_class = LogSerializer
     filterset_class = LogFilter
+    filter_backends = [DjangoFilterBackend, LogSearchFilter, filters.OrderingFilter]
     search_fields = ["message", "source"]
+    # Must match the columns of the FULLTEXT index used by LogSearchFilter
+    fulltext_search_fields = ["message"]
     ordering_fields = ["timestamp", "severity", "source"]
     permission_classes = [permissions.IsAuthenticated]
 
+    def get_queryset(self):
+        """Load only a message preview for list views; detail keeps the full text."""
+        qs = super().get_queryset()
+        if self.action == "list":
+            qs = qs.defer("message").annotate(
+                message_preview=Left("message", LIST_MESSAGE_PREVIEW_LENGTH),
+                message_truncated=GreaterThan(
+                    Length("message"), LIST_MESSAGE_PREVIEW_LENGTH
+                ),
+            )
+        return qs
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return LogListSerializer
+        return super().get_serializer_class()
+
     @action(detail=False, methods=["get"])
     def raw(self, request):
-        qs = self.filter_queryset(self.get_queryset())
+        """Unpaginated logs for the dashboard, capped at MAX_RAW_LOGS rows."""
+        qs = self.filter_queryset(self.get_queryset())[: settings.MAX_RAW_LOGS]
         serializer = self.get_serializer(qs, many=True)
         return Response(serializer.data)
 
@@ -75,27 +99,48 @@ class LogViewSet(viewsets.ModelViewSet):
     def aggregated(self, request):
         group_by = request.query_params.get("group_by", "date")
         interval = request.query_params.get("interval", "day")
-        qs = self.filter_queryset(self.get_queryset())
+        qs = self._aggregation_queryset()
 
         if group_by == "date":
-            ts = TruncDay("timestamp") if interval == "day" else TruncMonth("timestamp")
-            data = (
-                qs.annotate(period=ts)
-                .values("period")
-                .annotate(count=Count("id"))
-                .order_by("period")
-            )
-            result = [
-                {"date": item["period"].date().isoformat(), "count": item["count"]}
-                for item in data
-            ]
-            return Response(result)
+            return Response(self._count_by_date(qs, interval))
         elif group_by == "severity":
-            data = qs.values("severity").annotate(count=Count("id")).order_by("-count")
-            return Response(list(data))
+            return Response(self._count_by_field(qs, "severity"))
         else:  # source
-            data = qs.values("source").annotate(count=Count("id")).order_by("-count")
-            return Response(list(data))
+            return Response(self._count_by_field(qs, "source"))
+
+    @action(detail=False, methods=["get"])
+    def aggregated_all(self, request):
+        """Return the date, severity and source groupings in a single response."""
+        interval = request.query_params.get("interval", "day")
+        qs = self._aggregation_queryset()
+
+        return Response(
+            {
+                "by_date": self._count_by_date(qs, interval),
+                "by_severity": self._count_by_field(qs, "severity"),
+                "by_source": self._count_by_field(qs, "source"),
+            }
+        )
+
+    def _aggregation_queryset(self):
+        # Clear the default ordering so it doesn't leak into the GROUP BY
+        return self.filter_queryset(self.get_queryset()).order_by()
+
+    def _count_by_date(self, qs, interval):
+        ts = TruncDay("timestamp") if interval == "day" else TruncMonth("timestamp")
+        data = (
+            qs.annotate(period=ts)
+            .values("period")
+            .annotate(count=Count("id"))
+            .order_by("period")
+        )
+        return [
+            {"date": item["period"].date().isoformat(), "count": item["count"]}
+            for item in data
+        ]
+
+    def _count_by_field(self, qs, field):
+        return list(qs.values(field).annotate(count=Count("id")).order_by("-count"))
 
     @action(detail=False, methods=["get"])
     def export_csv(self, request):
@@ -103,15 +148,22 @@ class LogViewSet(viewsets.ModelViewSet):
         qs = self.filter_queryset(self.get_queryset())
 
         def generate_csv():
-            """Generator function for streaming CSV rows."""
-            writer = csv.writer(Echo())
+            """Generator function for streaming CSV rows in ~64KB chunks."""
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
             # Header
-            yield writer.writerow(["id", "timestamp", "message", "severity", "source"])
-            # Data rows
-            for log in qs.iterator(chunk_size=500):
-                yield writer.writerow(
-                    [log.id, log.timestamp, log.message, log.severity, log.source]
-                )
+            writer.writerow(["id", "timestamp", "message", "severity", "source"])
+            # Data rows as plain tuples, skipping model instantiation
+            rows = qs.values_list("id", "timestamp", "message", "severity", "source")
+            for row in rows.iterator(chunk_size=2000):
+                writer.writerow(row)
+                if buffer.tell() >= CSV_CHUNK_SIZE:
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+            # Flush whatever is left after the last full chunk
+            if buffer.tell():
+                yield buffer.getvalue()
 
         response = StreamingHttpResponse(generate_csv(), content_type="text/csv")
         response["Content-Disposition"] = 'attachment; filename="logs_export.csv"'
@@ -127,7 +179,11 @@ class UserFilterPreferenceViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Filter to current user's preferences only."""
-        return self.queryset.filter(user=self.request.user)
+        return (
+            self.queryset.select_related("user")
+            .filter(user=self.request.user)
+            .order_by("-created_at")
+        )
 
     def perform_create(self, serializer):
         """Assign the current user to the filter preference."""
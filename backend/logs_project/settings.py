@@ -105,6 +105,9 @@ REST_FRAMEWORK = {
     "PAGE_SIZE": 20,
 }
 
+# Upper bound on rows returned by the unpaginated /logs/raw/ endpoint
+MAX_RAW_LOGS = int(os.environ.get("MAX_RAW_LOGS", "10000"))
+
 from datetime import timedelta
 
 SIMPLE_JWT = {
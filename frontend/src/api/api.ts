@@ -19,6 +19,12 @@ export interface Log {
   source: string;
 }
 
+// List endpoint rows carry a message preview instead of the full message
+export interface LogListItem extends Omit<Log, "message"> {
+  message_preview: string;
+  message_truncated: boolean;
+}
+
 export const SEVERITY_OPTIONS: Log["severity"][] = [
   "DEBUG",
   "INFO",
@@ -88,7 +94,7 @@ const destroy = async (path: string, config?: AxiosRequestConfig) => {
 };
 
 export const listLogs = (params: LogQueryParams = {}) =>
-  get<PaginatedResponse<Log>>("/logs/", { params });
+  get<PaginatedResponse<LogListItem>>("/logs/", { params });
 
 export const getLog = (id: number) => get<Log>(`/logs/${id}/`);
 
@@ -100,9 +106,6 @@ export const updateLog = (id: number, payload: Partial<Omit<Log, "id">>) =>
 
 export const deleteLog = (id: number) => destroy(`/logs/${id}/`);
 
-export const getRawLogs = (params: LogQueryParams = {}) =>
-  get<Log[]>("/logs/raw/", { params });
-
 export interface AggregatedQueryParams extends LogQueryParams {
   group_by?: AggregateGroupBy;
   interval?: AggregateInterval;
@@ -110,3 +113,17 @@ export interface AggregatedQueryParams extends LogQueryParams {
 
 export const getAggregatedLogs = (params: AggregatedQueryParams = {}) =>
   get<AggregatedLogDatum[]>("/logs/aggregated/", { params });
+
+export interface AggregatedLogSummary {
+  by_date: AggregatedLogDatum[];
+  by_severity: AggregatedLogDatum[];
+  by_source: AggregatedLogDatum[];
+}
+
+export const getAggregatedLogSummary = (
+  params: Omit<AggregatedQueryParams, "group_by"> = {}
+) => get<AggregatedLogSummary>("/logs/aggregated_all/", { params });
+
+// Streamed server-side; no timeout since large exports can take a while
+export const exportLogsCsv = (params: LogQueryParams = {}) =>
+  get<Blob>("/logs/export_csv/", { params, responseType: "blob", timeout: 0 });
@@ -1,10 +1,10 @@
 import dayjs from "dayjs";
 
-import { type Log } from "@api/api";
+import { type LogListItem } from "@api/api";
 
 interface LogTableProps {
-  logs: Log[];
-  onSelect?: (log: Log) => void;
+  logs: LogListItem[];
+  onSelect?: (log: LogListItem) => void;
 }
 
 export function LogTable({ logs, onSelect }: LogTableProps) {
@@ -40,9 +40,9 @@ export function LogTable({ logs, onSelect }: LogTableProps) {
               <td className="px-4 py-3 font-medium">{log.severity}</td>
               <td className="px-4 py-3">{log.source}</td>
               <td className="px-4 py-3 text-muted-foreground">
-                {log.message.length > 120
-                  ? `${log.message.slice(0, 117)}...`
-                  : log.message}
+                {log.message_truncated
+                  ? `${log.message_preview}...`
+                  : log.message_preview}
               </td>
             </tr>
           ))}
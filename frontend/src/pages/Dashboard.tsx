@@ -11,11 +11,9 @@ import {
 import {
   type AggregateGroupBy,
   type AggregateInterval,
-  type AggregatedLogDatum,
-  type Log,
+  type AggregatedLogSummary,
   type LogQueryParams,
-  getAggregatedLogs,
-  getRawLogs,
+  getAggregatedLogSummary,
 } from "../api/api";
 import { FilterPanel, type LogFilterState } from "../components/FilterPanel";
 import { TrendChart } from "../components/TrendChart";
@@ -45,6 +43,12 @@ const SEVERITY_COLORS: Record<string, string> = {
 const DEFAULT_GROUP_BY: AggregateGroupBy = "date";
 const DEFAULT_INTERVAL: AggregateInterval = "day";
 
+const EMPTY_SUMMARY: AggregatedLogSummary = {
+  by_date: [],
+  by_severity: [],
+  by_source: [],
+};
+
 const sanitizeFilters = (filters: LogFilterState): LogQueryParams => {
   const query: LogQueryParams = {};
   if (filters.search) {
@@ -70,35 +74,27 @@ const Dashboard = () => {
   const [appliedFilters, setAppliedFilters] = useState<LogFilterState>({});
   const [groupBy, setGroupBy] = useState<AggregateGroupBy>(DEFAULT_GROUP_BY);
   const [interval, setInterval] = useState<AggregateInterval>(DEFAULT_INTERVAL);
-  const [chartData, setChartData] = useState<AggregatedLogDatum[]>([]);
-  const [rawLogs, setRawLogs] = useState<Log[]>([]);
+  const [summary, setSummary] = useState<AggregatedLogSummary>(EMPTY_SUMMARY);
   const [isLoading, setIsLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const wsRef = useRef<WebSocket | null>(null);
 
   const fetchData = useCallback(() => {
     const params = sanitizeFilters(appliedFilters);
-    const aggregatedParams = {
-      ...params,
-      group_by: groupBy,
-      ...(groupBy === "date" ? { interval } : {}),
-    };
 
     setIsLoading(true);
     setError(null);
 
-    void Promise.all([getAggregatedLogs(aggregatedParams), getRawLogs(params)])
-      .then(([aggregated, raw]) => {
-        setChartData(aggregated);
-        setRawLogs(raw);
-      })
+    // One request returns every grouping, counted server-side
+    void getAggregatedLogSummary({ ...params, interval })
+      .then(setSummary)
       .catch((err) => {
         setError(
           err instanceof Error ? err.message : "Unable to load dashboard data"
         );
       })
       .finally(() => setIsLoading(false));
-  }, [appliedFilters, groupBy, interval]);
+  }, [appliedFilters, interval]);
 
   useEffect(() => {
     fetchData();
@@ -140,12 +136,26 @@ const Dashboard = () => {
     };
   }, [fetchData]);
 
+  const chartData =
+    groupBy === "date"
+      ? summary.by_date
+      : groupBy === "severity"
+        ? summary.by_severity
+        : summary.by_source;
+
   const severityBreakdown = useMemo(() => {
-    return rawLogs.reduce<Record<string, number>>((acc, log) => {
-      acc[log.severity] = (acc[log.severity] ?? 0) + 1;
+    return summary.by_severity.reduce<Record<string, number>>((acc, item) => {
+      if (item.severity) {
+        acc[item.severity] = item.count;
+      }
       return acc;
     }, {});
-  }, [rawLogs]);
+  }, [summary]);
+
+  const totalLogs = useMemo(
+    () => summary.by_severity.reduce((total, item) => total + item.count, 0),
+    [summary]
+  );
 
   const severityChartData = useMemo(() => {
     return Object.entries(severityBreakdown).map(([name, value]) => ({
@@ -155,10 +165,7 @@ const Dashboard = () => {
     }));
   }, [severityBreakdown]);
 
-  const uniqueSources = useMemo(
-    () => new Set(rawLogs.map((log) => log.source)).size,
-    [rawLogs]
-  );
+  const uniqueSources = summary.by_source.length;
 
   const handleChangeFilters = (changes: Partial<LogFilterState>) => {
     setFilters((prev) => ({ ...prev, ...changes }));
@@ -296,12 +303,12 @@ const Dashboard = () => {
           <CardHeader>
             <CardTitle>Total logs</CardTitle>
             <CardDescription>
-              Count of raw logs matching current filters.
+              Count of logs matching current filters.
             </CardDescription>
           </CardHeader>
           <CardContent>
             <p className="text-3xl font-semibold">
-              {rawLogs.length.toLocaleString()}
+              {totalLogs.toLocaleString()}
             </p>
           </CardContent>
         </Card>
@@ -1,10 +1,14 @@
 import { saveAs } from "file-saver";
-import Papa from "papaparse";
 import { useCallback, useEffect, useMemo, useState } from "react";
 import { useNavigate } from "react-router-dom";
 import { toast } from "sonner";
 
-import { type Log, type LogQueryParams, getRawLogs, listLogs } from "@api/api";
+import {
+  type LogListItem,
+  type LogQueryParams,
+  exportLogsCsv,
+  listLogs,
+} from "@api/api";
 import { FilterPanel, type LogFilterState } from "@components/FilterPanel";
 import { LogTable } from "@components/LogTable";
 import { Button } from "@components/ui/button";
@@ -33,7 +37,7 @@ export default function LogList() {
   const navigate = useNavigate();
   const [filters, setFilters] = useState<LogFilterState>({});
   const [appliedFilters, setAppliedFilters] = useState<LogFilterState>({});
-  const [logs, setLogs] = useState<Log[]>([]);
+  const [logs, setLogs] = useState<LogListItem[]>([]);
   const [totalCount, setTotalCount] = useState(0);
   const [page, setPage] = useState(1);
   const [isLoading, setIsLoading] = useState(false);
@@ -85,9 +89,8 @@ export default function LogList() {
     setIsExporting(true);
     try {
       const query = buildQuery(appliedFilters);
-      const raw = await getRawLogs(query);
-      const csv = Papa.unparse(raw);
-      const blob = new Blob([csv], { type: "text/csv;charset=utf-8;" });
+      // Server streams every matching row, not just the first page
+      const blob = await exportLogsCsv(query);
       const timestamp = new Date().toISOString().replace(/[:.]/g, "-");
       saveAs(blob, `logs-export-${timestamp}.csv`);
       toast.success("CSV exported successfully!");
@@ -98,7 +101,7 @@ export default function LogList() {
     }
   };
 
-  const handleSelectLog = (log: Log) => {
+  const handleSelectLog = (log: LogListItem) => {
     navigate(`/logs/${log.id}`);
   };
 